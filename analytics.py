@@ -2,13 +2,22 @@
 import time
 import numpy as np
 from collections import deque
+from correlation_engine import CorrelationEngine
 
 class Analytics:
-    def __init__(self):
+    def __init__(self, market_data=True):
         self.trades = deque(maxlen=200)
         self.market_history = deque(maxlen=200)
         self.crypto_history = deque(maxlen=200)
 
+        # Streaming correlation of returns (crypto + Polymarket odds).
+        # Per-chat sessions only log trades and skip this.
+        self.correlation = (
+            CorrelationEngine(["BTC", "ETH", "LINK", "POLY"], windows=(20, 50, 200))
+            if market_data else None
+        )
+        self.heatmap_window = 50
+
     # ---------- LOGGING ----------
 
     def log_trade(self, signal, stake, tp, sl, profit_loss, confidence):
@@ -23,6 +32,14 @@ class Analytics:
         })
 
     def update_market_data(self, odds, btc, eth, link):
+        prev_odds = self.market_history[-1] if self.market_history else odds
+        self.correlation.update([
+            btc["price_change"],
+            eth["price_change"],
+            link["price_change"],
+            odds["up_prob"] - prev_odds["up_prob"]
+        ])
+
         self.market_history.append(odds)
         self.crypto_history.append([
             btc["price"],
@@ -55,30 +72,35 @@ class Analytics:
 
     # ---------- CORRELATION / HEATMAP ----------
 
-    def get_heatmap(self):
-        if len(self.crypto_history) < 10:
+    def get_heatmap(self, window=None):
+        """
+        Return correlations for every asset pair, e.g. {"BTC-ETH": 0.82, ...}.
+        """
+        if self.correlation is None:
             return None
-
-        data = np.array(self.crypto_history)
-        corr = np.corrcoef(data.T)
-
-        return {
-            "BTC-ETH": corr[0][1],
-            "BTC-LINK": corr[0][2],
-            "ETH-LINK": corr[1][2]
-        }
+        return self.correlation.pairs(window or self.heatmap_window)
 
     def get_correlation_map(self):
         heat = self.get_heatmap()
         if not heat:
             return "📈 Correlation Map\n\nNot enough data yet."
 
-        return (
-            "📈 Correlation Map\n\n"
-            f"BTC ↔ ETH: {heat['BTC-ETH']:.2f}\n"
-            f"BTC ↔ LINK: {heat['BTC-LINK']:.2f}\n"
-            f"ETH ↔ LINK: {heat['ETH-LINK']:.2f}"
-        )
+        window = self.correlation.samples(self.heatmap_window)
+        lines = [f"📈 Correlation Map (last {window} ticks)\n"]
+        for pair, value in heat.items():
+            a, b = pair.split("-")
+            lines.append(f"{a} ↔ {b}: {value:.2f}")
+
+        # Noise in an n-sample cross-correlation is ~1/sqrt(n); the best of
+        # ~20 scanned lags needs a wider margin than 2/sqrt(n) to mean anything
+        lead = self.correlation.lead_lag("BTC", "POLY")
+        n = self.correlation.samples(self.correlation.windows[-1])
+        if lead and lead[0] != 0 and abs(lead[1]) >= 3 / np.sqrt(n):
+            lag, value = lead
+            leader, follower = ("BTC", "POLY") if lag > 0 else ("POLY", "BTC")
+            lines.append(f"\n{leader} leads {follower} by {abs(lag)} ticks ({value:.2f})")
+
+        return "\n".join(lines)
 
     # ---------- PERFORMANCE METRICS ----------
 
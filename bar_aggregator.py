@@ -0,0 +1,107 @@
+# bar_aggregator.py
+import numpy as np
+
+TIME, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+FIELDS = ("time", "open", "high", "low", "close", "volume")
+
+
+class BarSeries:
+    """
+    OHLCV bars for one symbol at one resolution, stored in a fixed-size
+    ring buffer. The newest row is the current (still forming) bar.
+    Volume is the number of ticks in the bar.
+
+    Out-of-order ticks: a tick older than the current bar is dropped
+    (counted in `late`). A tick inside the current bar but older than its
+    latest tick updates high/low/volume and leaves the close alone.
+    """
+
+    def __init__(self, resolution, capacity=500):
+        self.resolution = resolution  # seconds per bar
+        self.capacity = capacity
+        self._data = np.zeros((capacity, len(FIELDS)))
+        self._pos = -1  # slot of the current bar
+        self._count = 0
+        self._last_ts = None  # timestamp of the tick that set the close
+        self.late = 0
+
+    def __len__(self):
+        return self._count
+
+    def update(self, value, ts):
+        start = ts - ts % self.resolution
+
+        if self._count:
+            current_start = self._data[self._pos, TIME]
+            if start < current_start:
+                self.late += 1
+                return
+
+            if start == current_start:
+                row = self._data[self._pos]
+                if value > row[HIGH]:
+                    row[HIGH] = value
+                if value < row[LOW]:
+                    row[LOW] = value
+                if ts >= self._last_ts:
+                    row[CLOSE] = value
+                    self._last_ts = ts
+                row[VOLUME] += 1
+                return
+
+        self._pos = (self._pos + 1) % self.capacity
+        self._data[self._pos] = (start, value, value, value, value, 1)
+        self._count = min(self._count + 1, self.capacity)
+        self._last_ts = ts
+
+    def current(self):
+        """Returns the forming bar as a dict, or None."""
+        if not self._count:
+            return None
+        return dict(zip(FIELDS, self._data[self._pos].tolist()))
+
+    def last(self, n):
+        """
+        Returns up to the last `n` bars (oldest first, current bar last)
+        as a dict of numpy arrays keyed by field.
+        """
+        n = min(n, self._count)
+        idx = (self._pos - n + 1 + np.arange(n)) % self.capacity
+        rows = self._data[idx]
+        return {name: rows[:, i] for i, name in enumerate(FIELDS)}
+
+
+class BarAggregator:
+    """
+    Builds bars at several resolutions incrementally as ticks arrive.
+    """
+
+    def __init__(self, resolutions=(1, 60, 300, 900), capacity=500):
+        self.resolutions = tuple(resolutions)
+        self.capacity = capacity
+        self.series = {}
+
+    def update(self, symbol, value, ts):
+        series = self.series.get(symbol)
+        if series is None:
+            series = {r: BarSeries(r, self.capacity) for r in self.resolutions}
+            self.series[symbol] = series
+
+        for bars in series.values():
+            bars.update(value, ts)
+
+    def get(self, symbol, resolution):
+        series = self.series.get(symbol)
+        if series is None:
+            return None
+        if resolution not in series:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        return series[resolution]
+
+    def current(self, symbol, resolution):
+        bars = self.get(symbol, resolution)
+        return bars.current() if bars else None
+
+    def last(self, symbol, resolution, n):
+        bars = self.get(symbol, resolution)
+        return bars.last(n) if bars else None
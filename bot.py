@@ -1,21 +1,32 @@
 # bot.py
 import os
+import io
 import asyncio
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes
-from paper_engine import PaperEngine
 from trade_manager import TradeManager
 from ml_engine import MLModel
 from crypto_data import CryptoData
 from portfolio_manager import PortfolioManager
 from analytics import Analytics
 from wallet_tracker import WalletTracker
+from profiler import Profiler
+from session_manager import SessionManager
 
 # Environment variables
 TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
 TRADING_MODE = os.environ.get("TRADING_MODE", "PAPER")
 ADMIN_CHAT_ID = os.environ.get("ADMIN_CHAT_ID")
 
+# Update delivery: POLLING or WEBHOOK
+BOT_MODE = os.environ.get("BOT_MODE", "POLLING")
+WEBHOOK_URL = os.environ.get("WEBHOOK_URL")  # public base URL, e.g. https://bot.example.com
+WEBHOOK_LISTEN = os.environ.get("WEBHOOK_LISTEN", "0.0.0.0")
+WEBHOOK_PORT = int(os.environ.get("WEBHOOK_PORT", "8443"))
+WEBHOOK_PATH = os.environ.get("WEBHOOK_PATH", "telegram")
+WEBHOOK_SECRET = os.environ.get("WEBHOOK_SECRET")  # required in WEBHOOK mode
+CONCURRENT_UPDATES = int(os.environ.get("CONCURRENT_UPDATES", "64"))
+
 if not TOKEN:
     raise ValueError("❌ TELEGRAM_BOT_TOKEN not set!")
 
@@ -25,8 +36,10 @@ ml_model = MLModel()
 portfolio = PortfolioManager()
 analytics_module = Analytics()
 wallet_tracker = WalletTracker()
-paper_engine = PaperEngine(crypto_data, ml_model, portfolio, analytics_module)
+session_manager = SessionManager(crypto_data, ml_model, analytics_module,
+                                 storage_dir=os.environ.get("SESSION_DIR", "sessions"))
 trade_manager = TradeManager(crypto_data, ml_model, portfolio, analytics_module, wallet_tracker)
+profiler = Profiler()
 
 # Commands
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -45,13 +58,26 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     await query.answer()
+    chat_id = update.effective_chat.id
     if query.data == "dashboard":
-        dash = analytics_module.get_dashboard()
+        session = session_manager.get(chat_id)
+        dash = session.analytics.get_dashboard()
+        status = session.portfolio.get_status()
         corr = analytics_module.get_correlation_map()
-        await query.edit_message_text(f"{dash}\n\n{corr}")
+        text = f"{dash}\n\nBalance: {status['balance_eth']} ETH (P/L {status['pnl']})\n\n{corr}"
+        if trade_manager.running:
+            text += f"\n\n💰 Real Mode\n{analytics_module.get_dashboard()}"
+        await query.edit_message_text(text)
     elif query.data == "paper_mode":
-        await query.edit_message_text("🧪 Paper Mode active. Learning in background...")
-        asyncio.create_task(paper_engine.run_simulations())
+        session_manager.start(chat_id)
+        stop_markup = InlineKeyboardMarkup([[InlineKeyboardButton("⏹ Stop Paper Mode", callback_data="paper_stop")]])
+        await query.edit_message_text(
+            "🧪 Paper Mode active. Learning in background...",
+            reply_markup=stop_markup
+        )
+    elif query.data == "paper_stop":
+        session_manager.stop(chat_id)
+        await query.edit_message_text("⏹ Paper Mode stopped.")
     elif query.data == "real_mode":
         if TRADING_MODE.upper() != "REAL":
             await query.edit_message_text("⚠️ Real Mode disabled. Set TRADING_MODE=REAL to enable.")
@@ -62,13 +88,108 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         mode = TRADING_MODE.upper()
         await query.edit_message_text(f"⚙️ Settings\nTrading Mode: {mode}\nWallet Connected: {wallet_tracker.enabled}")
 
+# Admin: profiling
+def is_admin(update: Update) -> bool:
+    return bool(ADMIN_CHAT_ID) and str(update.effective_chat.id) == str(ADMIN_CHAT_ID)
+
+async def profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    /profile <cpu|mem|all> [seconds]  - profile the live trading loop
+    /profile stop                     - end the current session early
+    """
+    if not is_admin(update):
+        return
+
+    args = context.args or []
+    kind = args[0].lower() if args else "cpu"
+
+    if kind == "stop":
+        if profiler.stop():
+            await update.message.reply_text("⏹ Stopping profiler...")
+        else:
+            await update.message.reply_text("ℹ️ Profiler is not running.")
+        return
+
+    if kind not in Profiler.KINDS:
+        await update.message.reply_text("Usage: /profile <cpu|mem|all> [seconds] | /profile stop")
+        return
+    try:
+        seconds = int(args[1]) if len(args) > 1 else 30
+    except ValueError:
+        await update.message.reply_text("⚠️ Seconds must be a whole number.")
+        return
+
+    # Claim the profiler before any await so concurrent commands can't both start
+    if profiler.running:
+        await update.message.reply_text(f"⚠️ Profiler already running ({profiler.kind}).")
+        return
+    profiler.start(kind, seconds)
+    asyncio.create_task(_run_profile(context, update.effective_chat.id, kind))
+
+    await update.message.reply_text(f"🔬 Profiling ({kind}) for up to {seconds}s...")
+
+async def _run_profile(context, chat_id, kind):
+    try:
+        report = await profiler.wait()
+    except Exception as e:
+        await context.bot.send_message(chat_id=chat_id, text=f"[Profiler Error] {e}")
+        return
+
+    # Telegram caps messages at 4096 chars; fall back to a file
+    if len(report) > 4000:
+        await context.bot.send_document(
+            chat_id=chat_id,
+            document=io.BytesIO(report.encode()),
+            filename=f"profile_{kind}.txt"
+        )
+    else:
+        await context.bot.send_message(chat_id=chat_id, text=report)
+
 # Main entry
-def main():
-    app = Application.builder().token(TOKEN).build()
+async def _post_init(app: Application):
+    # Start the shared market loop; it also feeds the correlation map
+    session_manager.ensure_running()
+
+async def _post_shutdown(app: Application):
+    await crypto_data.close()
+
+def build_application(base_url=None):
+    """
+    Builds the bot application. `base_url` overrides the Bot API endpoint
+    (used by webhook_loadtest.py to point at a local stand-in).
+    """
+    builder = Application.builder().token(TOKEN).concurrent_updates(CONCURRENT_UPDATES)
+    if base_url:
+        builder = builder.base_url(base_url)
+    builder = builder.post_init(_post_init).post_shutdown(_post_shutdown)
+    app = builder.build()
+
     app.add_handler(CommandHandler("start", start))
+    app.add_handler(CommandHandler("profile", profile))
     app.add_handler(CallbackQueryHandler(button_handler))
-    print("✅ PolyPulse Bot starting...")
-    app.run_polling()  # ✅ This handles initialize/start/idle internally
+    return app
+
+def main():
+    app = build_application()
+    mode = BOT_MODE.upper()
+    print(f"✅ PolyPulse Bot starting ({mode})...")
+    try:
+        if mode == "WEBHOOK":
+            if not WEBHOOK_URL:
+                raise ValueError("❌ WEBHOOK_URL not set!")
+            if not WEBHOOK_SECRET:
+                raise ValueError("❌ WEBHOOK_SECRET not set!")
+            app.run_webhook(
+                listen=WEBHOOK_LISTEN,
+                port=WEBHOOK_PORT,
+                url_path=WEBHOOK_PATH,
+                webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{WEBHOOK_PATH}",
+                secret_token=WEBHOOK_SECRET
+            )
+        else:
+            app.run_polling()  # ✅ This handles initialize/start/idle internally
+    finally:
+        session_manager.save_all()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,132 @@
+# correlation_engine.py
+import numpy as np
+
+class CorrelationEngine:
+    """
+    Streaming correlation over several rolling windows.
+    Keeps running sums and cross-products of returns per window,
+    so each tick costs O(N²) regardless of window length.
+    """
+
+    def __init__(self, assets, windows=(20, 50, 200), min_samples=10):
+        self.assets = list(assets)
+        self.windows = tuple(sorted(windows))
+        self.min_samples = min_samples
+
+        n = len(self.assets)
+        self._capacity = self.windows[-1]
+        self._buffer = np.zeros((self._capacity, n))
+        self._pos = 0
+        self._count = 0
+
+        # Co-moments per window
+        self._sums = {w: np.zeros(n) for w in self.windows}
+        self._cross = {w: np.zeros((n, n)) for w in self.windows}
+
+    # ---------- UPDATE ----------
+
+    def update(self, returns):
+        """
+        Adds one tick of returns (one value per asset, in asset order).
+        """
+        r = np.asarray(returns, dtype=float)
+
+        for w in self.windows:
+            if self._count >= w:
+                old = self._buffer[(self._pos - w) % self._capacity]
+                self._sums[w] -= old
+                self._cross[w] -= np.outer(old, old)
+            self._sums[w] += r
+            self._cross[w] += np.outer(r, r)
+
+        self._buffer[self._pos] = r
+        self._pos = (self._pos + 1) % self._capacity
+        self._count += 1
+
+        # Refresh from the buffer once per full cycle to stop float drift
+        if self._pos == 0:
+            self._recompute()
+
+    def _recompute(self):
+        for w in self.windows:
+            rows = self._window_rows(w)
+            self._sums[w] = rows.sum(axis=0)
+            self._cross[w] = rows.T @ rows
+
+    def _window_rows(self, window):
+        n = min(self._count, window)
+        idx = (self._pos - n + np.arange(n)) % self._capacity
+        return self._buffer[idx]
+
+    # ---------- QUERIES ----------
+
+    def samples(self, window):
+        return min(self._count, window)
+
+    def correlation_matrix(self, window=None):
+        """
+        Returns the correlation matrix for `window`, or None if not enough data.
+        """
+        window = window or self.windows[0]
+        if window not in self._sums:
+            raise ValueError(f"Unknown window: {window}")
+
+        n = self.samples(window)
+        if n < self.min_samples:
+            return None
+
+        mean = self._sums[window] / n
+        cov = self._cross[window] / n - np.outer(mean, mean)
+        std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        denom = np.outer(std, std)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.where(denom > 0, cov / denom, 0.0)
+        np.fill_diagonal(corr, 1.0)
+        return np.clip(corr, -1.0, 1.0)
+
+    def pairs(self, window=None):
+        """
+        Returns {"A-B": corr} for every asset pair.
+        """
+        corr = self.correlation_matrix(window)
+        if corr is None:
+            return None
+
+        result = {}
+        for i, a in enumerate(self.assets):
+            for j in range(i + 1, len(self.assets)):
+                result[f"{a}-{self.assets[j]}"] = float(corr[i][j])
+        return result
+
+    # ---------- LEAD / LAG ----------
+
+    def lead_lag(self, asset_a, asset_b, window=None, max_lag=10):
+        """
+        FFT cross-correlation of two assets' returns.
+        Returns (lag, corr); a positive lag means asset_a leads asset_b.
+        """
+        window = window or self.windows[-1]
+        n = self.samples(window)
+        if n < self.min_samples:
+            return None
+
+        rows = self._window_rows(window)
+        x = rows[:, self.assets.index(asset_a)]
+        y = rows[:, self.assets.index(asset_b)]
+        x = x - x.mean()
+        y = y - y.mean()
+
+        scale = np.sqrt(np.dot(x, x) * np.dot(y, y))
+        if scale == 0:
+            return 0, 0.0
+
+        size = 1 << (2 * n - 1).bit_length()
+        xcorr = np.fft.irfft(np.conj(np.fft.rfft(x, size)) * np.fft.rfft(y, size), size)
+
+        max_lag = min(max_lag, n - 1)
+        lags = np.arange(-max_lag, max_lag + 1)
+        values = xcorr[lags % size] / scale
+
+        best = int(np.argmax(np.abs(values)))
+        return int(lags[best]), float(values[best])
@@ -1,36 +1,132 @@
 # crypto_data.py
 import asyncio
+import os
 import random
 import time
 from collections import deque
+from bar_aggregator import BarAggregator
+
+class FeedError(RuntimeError):
+    """Raised when streamed data is unavailable, disconnected or stale."""
+
 
 class CryptoData:
-    def __init__(self):
+    def __init__(self, feed_url=None, ready_timeout=None, max_age=None):
         # Historical caches
         self.polymarket_history = deque(maxlen=500)
         self.btc_history = deque(maxlen=500)
         self.eth_history = deque(maxlen=500)
         self.link_history = deque(maxlen=500)
 
-        self.ws_connected = False
+        # OHLCV bars (1s / 1m / 5m / 15m) built as ticks arrive
+        self.bars = BarAggregator(resolutions=(1, 60, 300, 900))
+
+        # Websocket stream (FEED_WS_URL); simulated data when unset
+        self.feed_url = feed_url or os.environ.get("FEED_WS_URL")
+        self.feed = None
+        self._feed_task = None
+        self._simulated_connected = False
+        self.ready_timeout = ready_timeout or float(os.environ.get("FEED_READY_TIMEOUT", "10"))
+        self.max_age = max_age or float(os.environ.get("FEED_MAX_AGE", "5"))  # seconds
 
     # ---------- CONNECTION ----------
 
+    @property
+    def ws_connected(self):
+        if self.feed is not None:
+            return self.feed.connected
+        return self._simulated_connected
+
     async def connect_ws(self):
         """
-        Simulated low-latency websocket connection.
-        Keeps async structure compatible with real APIs later.
+        Starts the websocket stream and waits up to ready_timeout for the
+        first value of every symbol (raises FeedError otherwise).
+        Without a feed URL this stays a simulated connection.
+        """
+        if not self.feed_url:
+            await asyncio.sleep(0.1)
+            self._simulated_connected = True
+            return
+
+        if self.feed is None:
+            from stream_feed import StreamFeed
+            self.feed = StreamFeed(self.feed_url, on_message=self._on_stream_message)
+            self._feed_task = asyncio.create_task(self.feed.run())
+
+        try:
+            await asyncio.wait_for(self.feed.ready.wait(), timeout=self.ready_timeout)
+        except asyncio.TimeoutError:
+            missing = [s for s in self.feed.symbols if s not in self.feed.latest]
+            raise FeedError(f"Feed not ready after {self.ready_timeout}s (missing: {', '.join(missing)})")
+
+    async def close(self):
+        """Stops the websocket stream, if one was started."""
+        if self.feed is not None:
+            self.feed.stop()
+        if self._feed_task is not None:
+            self._feed_task.cancel()
+            try:
+                await self._feed_task
+            except asyncio.CancelledError:
+                pass
+            self._feed_task = None
+
+    async def _stream(self, symbols):
+        """
+        Returns the ready stream, or None when running simulated.
+        Raises FeedError while disconnected or when `symbols` are older than max_age.
         """
-        await asyncio.sleep(0.1)
-        self.ws_connected = True
+        if not self.feed_url:
+            return None
+        if self.feed is None or not self.feed.ready.is_set():
+            await self.connect_ws()
+
+        feed = self.feed
+        if not feed.connected:
+            raise FeedError("Feed disconnected")
+        for symbol in symbols:
+            age = feed.age(symbol)
+            if age > self.max_age:
+                raise FeedError(f"{symbol} data is stale ({age:.1f}s old)")
+        return feed
+
+    def changes_since(self, previous, market):
+        """
+        For trading loops reading the stream faster than it ticks.
+        `market` is (odds, btc, eth, link) as returned by the getters and
+        `previous` the unmodified tuple the loop last processed (or None).
+
+        Returns None when nothing has changed since `previous`; otherwise
+        `market` with each price_change measured against the price in
+        `previous`, so repeated or skipped ticks aren't double-counted.
+        Simulated data is returned as-is.
+        """
+        if self.feed is None or previous is None:
+            return market
+        if all(a is b for a, b in zip(previous, market)):
+            return None
+
+        odds = market[0]
+        prices = []
+        for prev, data in zip(previous[1:], market[1:]):
+            if prev is not data:
+                data = dict(data, price_change=round(data["price"] / prev["price"] - 1, 6))
+            else:
+                data = dict(data, price_change=0.0)
+            prices.append(data)
+        return (odds, *prices)
 
     # ---------- POLYMARKET (15 MIN UP/DOWN) ----------
 
     async def get_polymarket_odds(self):
         """
-        Returns simulated Polymarket odds.
-        Replace later with real Polymarket API.
+        Returns the latest streamed Polymarket odds,
+        or simulated odds when no feed is configured.
         """
+        feed = await self._stream(("POLY",))
+        if feed:
+            return feed.latest["POLY"]
+
         up_prob = random.uniform(0.45, 0.55)
         down_prob = 1 - up_prob
 
@@ -41,6 +137,7 @@ class CryptoData:
         }
 
         self.polymarket_history.append(odds)
+        self.bars.update("POLY", odds["up_prob"], odds["timestamp"])
         return odds
 
     # ---------- CRYPTO PRICES ----------
@@ -48,16 +145,73 @@ class CryptoData:
     async def get_crypto_data(self):
         """
         Returns BTC, ETH, LINK price + price change.
+        Streamed values are shared snapshots that repeat until the next
+        tick; loops should pass them through changes_since().
         """
-        btc = self._generate_price(self.btc_history, base=65000)
-        eth = self._generate_price(self.eth_history, base=3200)
-        link = self._generate_price(self.link_history, base=18)
+        feed = await self._stream(("BTC", "ETH", "LINK"))
+        if feed:
+            latest = feed.latest
+            return latest["BTC"], latest["ETH"], latest["LINK"]
+
+        btc = self._generate_price("BTC", self.btc_history, base=65000)
+        eth = self._generate_price("ETH", self.eth_history, base=3200)
+        link = self._generate_price("LINK", self.link_history, base=18)
 
         return btc, eth, link
 
+    # ---------- BARS ----------
+
+    def get_bars(self, symbol, resolution=900, n=1):
+        """
+        Returns the last `n` bars for symbol ("BTC", "ETH", "LINK", "POLY")
+        at `resolution` seconds, current bar last.
+        """
+        return self.bars.last(symbol, resolution, n)
+
+    def get_current_bar(self, symbol, resolution=900):
+        return self.bars.current(symbol, resolution)
+
     # ---------- INTERNAL HELPERS ----------
 
-    def _generate_price(self, history, base):
+    def _on_stream_message(self, msg):
+        """
+        Converts a stream message into the same shape as the simulated
+        data and records it in the history and bars.
+        """
+        symbol = msg["symbol"]
+        ts = msg.get("ts") or time.time()
+
+        if msg.get("channel") == "odds":
+            up_prob = msg["up_prob"]
+            odds = {
+                "up_prob": up_prob,
+                "down_prob": msg.get("down_prob", round(1 - up_prob, 4)),
+                "timestamp": ts
+            }
+            self.polymarket_history.append(odds)
+            self.bars.update(symbol, up_prob, ts)
+            return odds
+
+        history = {
+            "BTC": self.btc_history,
+            "ETH": self.eth_history,
+            "LINK": self.link_history
+        }.get(symbol)
+        if history is None:
+            return None
+
+        price = msg["price"]
+        prev = history[-1]["price"] if history else price
+        data = {
+            "price": price,
+            "price_change": round(price / prev - 1, 6),
+            "time": ts
+        }
+        history.append(data)
+        self.bars.update(symbol, price, ts)
+        return data
+
+    def _generate_price(self, symbol, history, base):
         """
         Generates realistic micro price movement.
         """
@@ -76,4 +230,5 @@ class CryptoData:
         }
 
         history.append(data)
+        self.bars.update(symbol, data["price"], data["time"])
         return data
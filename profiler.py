@@ -0,0 +1,204 @@
+# profiler.py
+import asyncio
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+class Profiler:
+    """
+    On-demand profiling of the live process.
+    Nothing is installed until a session is started, so there is
+    no overhead while profiling is off.
+    """
+
+    KINDS = ("cpu", "mem", "all")
+
+    def __init__(self, sample_interval=0.005, top_n=15, max_seconds=300):
+        self.sample_interval = sample_interval  # seconds between CPU samples
+        self.top_n = top_n
+        self.max_seconds = max_seconds
+
+        self.running = False
+        self.kind = None
+
+        # CPU sampler state
+        self._sampler = None
+        self._sampler_stop = threading.Event()
+        self._target_thread = None
+        self._samples = 0
+        self._self_counts = Counter()
+        self._cum_counts = Counter()
+
+        # Memory state
+        self._mem_baseline = None
+        self._started_tracemalloc = False
+
+        self._started_at = 0.0
+        self._seconds = 0
+        self._stop_requested = None
+
+    # ---------- SESSION ----------
+
+    def start(self, kind="cpu", seconds=30):
+        """
+        Claims the profiler and starts a session. Must be called from the
+        event loop thread; follow with wait() to collect the report.
+        """
+        if self.running:
+            raise RuntimeError("Profiling already running")
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown profile kind: {kind}")
+
+        self._seconds = max(1, min(int(seconds), self.max_seconds))
+        self._stop_requested = asyncio.Event()
+        self._start(kind)
+
+    async def wait(self):
+        """
+        Waits for the session to time out (or stop()) and returns a text report.
+        """
+        try:
+            await asyncio.wait_for(self._stop_requested.wait(), timeout=self._seconds)
+        except asyncio.TimeoutError:
+            pass
+        return self._finish()
+
+    async def run(self, kind="cpu", seconds=30):
+        """
+        Profiles the running event loop for `seconds` (or until stop()).
+        Returns a text report.
+        """
+        self.start(kind, seconds)
+        return await self.wait()
+
+    def stop(self):
+        """Ends the current session early. Returns False if none is running."""
+        if not self.running or self._stop_requested is None:
+            return False
+        self._stop_requested.set()
+        return True
+
+    def _start(self, kind):
+        self.running = True
+        self.kind = kind
+        self._started_at = time.time()
+
+        if kind in ("cpu", "all"):
+            self._start_cpu(threading.get_ident())
+        if kind in ("mem", "all"):
+            self._start_memory()
+
+    def _finish(self):
+        duration = time.time() - self._started_at
+        sections = []
+
+        if self.kind in ("cpu", "all"):
+            sections.append(self._stop_cpu(duration))
+        if self.kind in ("mem", "all"):
+            sections.append(self._stop_memory(duration))
+
+        self.running = False
+        self.kind = None
+        self._stop_requested = None
+        return "\n\n".join(sections)
+
+    # ---------- CPU SAMPLING ----------
+
+    def _start_cpu(self, thread_id):
+        self._target_thread = thread_id
+        self._samples = 0
+        self._self_counts.clear()
+        self._cum_counts.clear()
+        self._sampler_stop.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="profiler-sampler", daemon=True
+        )
+        self._sampler.start()
+
+    def _sample_loop(self):
+        while not self._sampler_stop.wait(self.sample_interval):
+            frame = sys._current_frames().get(self._target_thread)
+            if frame is None:
+                continue
+
+            self._samples += 1
+            self._self_counts[self._frame_key(frame)] += 1
+
+            seen = set()
+            while frame is not None:
+                key = self._frame_key(frame)
+                if key not in seen:
+                    seen.add(key)
+                    self._cum_counts[key] += 1
+                frame = frame.f_back
+
+    def _stop_cpu(self, duration):
+        self._sampler_stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+        total = self._samples
+        lines = [f"🔬 CPU Profile ({total} samples over {duration:.1f}s)"]
+        if not total:
+            lines.append("No samples collected.")
+            return "\n".join(lines)
+
+        lines.append("self%  cum%  function")
+        for key, count in self._self_counts.most_common(self.top_n):
+            self_pct = count / total * 100
+            cum_pct = self._cum_counts[key] / total * 100
+            lines.append(f"{self_pct:5.1f} {cum_pct:5.1f}  {self._format_key(key)}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _frame_key(frame):
+        code = frame.f_code
+        return (code.co_filename, code.co_firstlineno, code.co_name)
+
+    @staticmethod
+    def _format_key(key):
+        filename, lineno, name = key
+        return f"{name} ({filename.rsplit('/', 1)[-1]}:{lineno})"
+
+    # ---------- MEMORY SNAPSHOT ----------
+
+    def _start_memory(self):
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start(10)
+        self._mem_baseline = self._take_snapshot()
+
+    def _stop_memory(self, duration):
+        snapshot = self._take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        stats = snapshot.compare_to(self._mem_baseline, "lineno")
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        self._mem_baseline = None
+        self._started_tracemalloc = False
+
+        lines = [
+            f"🧠 Memory Profile ({duration:.1f}s)",
+            f"Traced: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)",
+            "Top allocation sites (growth since start):",
+        ]
+        for stat in stats[:self.top_n]:
+            frame = stat.traceback[0]
+            lines.append(
+                f"{stat.size_diff / 1024:+9.1f} KiB {stat.count_diff:+7d} blocks  "
+                f"{frame.filename.rsplit('/', 1)[-1]}:{frame.lineno}"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def _take_snapshot():
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
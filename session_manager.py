@@ -0,0 +1,201 @@
+# session_manager.py
+import asyncio
+import os
+import pickle
+import random
+import time
+from crypto_data import CryptoData
+from ml_engine import MLModel
+from portfolio_manager import PortfolioManager
+from analytics import Analytics
+
+class PaperSession:
+    """Per-chat paper portfolio and trade stats."""
+
+    def __init__(self, chat_id):
+        self.chat_id = chat_id
+        self.portfolio = PortfolioManager()
+        self.analytics = Analytics(market_data=False)
+        self.running = False
+        self.last_active = time.time()
+
+    def touch(self):
+        self.last_active = time.time()
+
+
+class SessionManager:
+    """
+    Isolated paper sessions for every chat, all driven by one loop.
+    Each tick does a single data fetch and a single model evaluation,
+    then applies the result to every running session.
+    The loop is also the only writer of market data into the shared
+    Analytics, so it keeps ticking while no session is running.
+    Idle sessions are pickled to disk and reloaded on next access.
+    """
+
+    def __init__(self, crypto_data: CryptoData, ml_model: MLModel,
+                 analytics: Analytics, storage_dir="sessions",
+                 idle_timeout=1800):
+        self.crypto_data = crypto_data
+        self.ml_model = ml_model
+        self.analytics = analytics  # shared market analytics (correlation map)
+        self.storage_dir = storage_dir
+        self.idle_timeout = idle_timeout  # seconds without interaction before eviction
+
+        self.sessions = {}
+        self.running = False
+        self._task = None
+        self._last_market = None
+        self.simulation_speed = 0.2  # seconds per tick
+        self.eviction_interval = 60
+        self._last_eviction = time.time()
+
+    # ---------- SESSIONS ----------
+
+    def get(self, chat_id):
+        """
+        Returns the chat's session, loading it from disk or creating it.
+        """
+        session = self.sessions.get(chat_id)
+        if session is None:
+            session = self._load(chat_id) or PaperSession(chat_id)
+            self.sessions[chat_id] = session
+            if session.running:
+                self.ensure_running()  # resume a session saved while trading
+        session.touch()
+        return session
+
+    def peek(self, chat_id):
+        """Returns the in-memory session without creating one."""
+        return self.sessions.get(chat_id)
+
+    def start(self, chat_id):
+        session = self.get(chat_id)
+        session.running = True
+        self.ensure_running()
+        return session
+
+    def stop(self, chat_id):
+        session = self.get(chat_id)
+        session.running = False
+        return session
+
+    # ---------- MAIN LOOP ----------
+
+    def ensure_running(self):
+        """Starts the shared loop as a background task if it isn't running."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no event loop yet; run() must be started explicitly
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def run(self):
+        """Shared paper trading loop for all sessions"""
+        if self.running:
+            return  # Already running
+
+        self.running = True
+        print("🧪 SessionManager started in background...")
+
+        while self.running:
+            try:
+                await self._tick()
+                delay = self.simulation_speed
+            except Exception as e:
+                print(f"[SessionManager Error] {e}")
+                delay = 1
+
+            # Separate from the tick so a failing tick can't block eviction
+            if time.time() - self._last_eviction >= self.eviction_interval:
+                try:
+                    self.evict_idle()
+                except Exception as e:
+                    print(f"[SessionManager Error] eviction: {e}")
+
+            await asyncio.sleep(delay)
+
+    async def _tick(self):
+        polymarket_odds = await self.crypto_data.get_polymarket_odds()
+        btc, eth, link = await self.crypto_data.get_crypto_data()
+
+        # Skip ticks the stream hasn't advanced since the last one
+        raw = (polymarket_odds, btc, eth, link)
+        market = self.crypto_data.changes_since(self._last_market, raw)
+        if market is None:
+            return
+        self._last_market = raw
+        polymarket_odds, btc, eth, link = market
+
+        self.analytics.update_market_data(polymarket_odds, btc, eth, link)
+
+        active = [s for s in self.sessions.values() if s.running]
+        if not active:
+            return
+
+        signal, confidence = self.ml_model.predict(polymarket_odds, btc, eth, link)
+
+        # One market outcome per tick, shared by every session
+        multiplier = self._market_multiplier(signal)
+
+        for session in active:
+            portfolio = session.portfolio
+            stake = portfolio.calculate_stake(confidence)
+            tp, sl = portfolio.calculate_tp_sl(confidence)
+            profit_loss = stake * (multiplier - 1)
+
+            portfolio.update_balance(profit_loss)
+            session.analytics.log_trade(signal, stake, tp, sl, profit_loss, confidence)
+
+    def _market_multiplier(self, signal):
+        if signal == "UP":
+            return random.uniform(0.95, 1.05)
+        if signal == "DOWN":
+            return random.uniform(0.95, 1.02)
+        return 1.0
+
+    # ---------- EVICTION ----------
+
+    def evict_idle(self):
+        """
+        Moves sessions idle for longer than idle_timeout to disk.
+        A running session pauses while on disk and resumes trading on
+        the chat's next get().
+        """
+        self._last_eviction = time.time()
+        cutoff = self._last_eviction - self.idle_timeout
+
+        for chat_id, session in list(self.sessions.items()):
+            if session.last_active < cutoff:
+                try:
+                    self._save(session)
+                    del self.sessions[chat_id]
+                except Exception as e:
+                    print(f"[SessionManager Error] evict {chat_id}: {e}")
+
+    def save_all(self):
+        for session in self.sessions.values():
+            self._save(session)
+
+    def _path(self, chat_id):
+        return os.path.join(self.storage_dir, f"{chat_id}.pkl")
+
+    def _save(self, session):
+        os.makedirs(self.storage_dir, exist_ok=True)
+        path = self._path(session.chat_id)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(session, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def _load(self, chat_id):
+        path = self._path(chat_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"[SessionManager Error] load {chat_id}: {e}")
+            return None
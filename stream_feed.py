@@ -0,0 +1,147 @@
+# stream_feed.py
+import asyncio
+import json
+import random
+import time
+import websockets
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional: faster decoding when installed
+    _loads = json.loads
+
+class StreamFeed:
+    """
+    Websocket streaming adapter for price and odds feeds.
+
+    Messages are JSON objects (or lists of them) of the form
+        {"channel": "price", "symbol": "BTC", "seq": 42, "price": 65000.0, "ts": ...}
+        {"channel": "odds", "symbol": "POLY", "seq": 7, "up_prob": 0.51, "down_prob": 0.49, "ts": ...}
+
+    `seq` increases by one per symbol; skipped numbers are counted as gaps.
+    The connection is re-established with backoff and every channel is
+    resubscribed after a reconnect.
+    """
+
+    def __init__(self, url, channels=("price", "odds"), symbols=("BTC", "ETH", "LINK", "POLY"),
+                 on_message=None, max_backoff=30.0):
+        self.url = url
+        self.channels = list(channels)
+        self.symbols = list(symbols)
+        self.on_message = on_message  # called with every decoded message
+        self.max_backoff = max_backoff
+
+        self.connected = False
+        self.running = False
+        self.ready = asyncio.Event()  # set once every symbol has a value
+
+        # Latest message per symbol. Entries are replaced, never mutated,
+        # so readers always see a complete message.
+        self.latest = {}
+        self.received = {}  # monotonic receive time per symbol
+
+        # Stats
+        self.last_seq = {}
+        self.gaps = 0
+        self.stale = 0
+        self.reconnects = 0
+        self.messages = 0
+
+    # ---------- CONNECTION ----------
+
+    async def run(self):
+        """Connect, subscribe and stream until stop() is called"""
+        if self.running:
+            return  # Already running
+
+        self.running = True
+        backoff = 0.5
+
+        while self.running:
+            try:
+                async with websockets.connect(self.url, max_queue=None) as ws:
+                    await self._subscribe(ws)
+                    self.connected = True
+                    backoff = 0.5
+                    print(f"📡 StreamFeed connected: {self.url}")
+
+                    async for raw in ws:
+                        self._handle(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[StreamFeed Error] {e}")
+            finally:
+                self.connected = False
+
+            if not self.running:
+                break
+
+            # Sequence numbers restart with the new subscription
+            self.last_seq.clear()
+            self.reconnects += 1
+            await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+            backoff = min(backoff * 2, self.max_backoff)
+
+    async def _subscribe(self, ws):
+        await ws.send(json.dumps({
+            "type": "subscribe",
+            "channels": self.channels,
+            "symbols": self.symbols
+        }))
+
+    def stop(self):
+        self.running = False
+
+    # ---------- MESSAGES ----------
+
+    def _handle(self, raw):
+        data = _loads(raw)
+        if isinstance(data, list):
+            for msg in data:
+                self._apply(msg)
+        else:
+            self._apply(data)
+
+    def _apply(self, msg):
+        symbol = msg.get("symbol")
+        if symbol is None:
+            return  # control message (e.g. subscription ack)
+
+        seq = msg.get("seq")
+        if seq is not None:
+            last = self.last_seq.get(symbol)
+            if last is not None:
+                if seq <= last:
+                    self.stale += 1
+                    return
+                if seq > last + 1:
+                    self.gaps += seq - last - 1  # reported via get_stats()
+            self.last_seq[symbol] = seq
+
+        self.messages += 1
+        if self.on_message:
+            msg = self.on_message(msg) or msg
+        self.latest[symbol] = msg
+        self.received[symbol] = time.monotonic()
+
+        if not self.ready.is_set() and all(s in self.latest for s in self.symbols):
+            self.ready.set()
+
+    def get(self, symbol):
+        return self.latest.get(symbol)
+
+    def age(self, symbol):
+        """Seconds since the last message for symbol (inf if none yet)."""
+        received = self.received.get(symbol)
+        return time.monotonic() - received if received is not None else float("inf")
+
+    def get_stats(self):
+        return {
+            "connected": self.connected,
+            "messages": self.messages,
+            "gaps": self.gaps,
+            "stale": self.stale,
+            "reconnects": self.reconnects
+        }
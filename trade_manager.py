@@ -17,6 +17,7 @@ class TradeManager:
         self.analytics = analytics
         self.wallet_tracker = wallet_tracker
         self.running = False
+        self._last_market = None
         self.simulation_speed = 0.2  # micro-decision speed
 
     async def run_real_trading(self):
@@ -37,6 +38,15 @@ class TradeManager:
                 polymarket_odds = await self.crypto_data.get_polymarket_odds()
                 btc, eth, link = await self.crypto_data.get_crypto_data()
 
+                # Skip ticks the stream hasn't advanced since the last iteration
+                raw = (polymarket_odds, btc, eth, link)
+                market = self.crypto_data.changes_since(self._last_market, raw)
+                if market is None:
+                    await asyncio.sleep(self.simulation_speed)
+                    continue
+                self._last_market = raw
+                polymarket_odds, btc, eth, link = market
+
                 # Predict trade signal
                 signal, confidence = self.ml_model.predict(
                     polymarket_odds, btc, eth, link
@@ -49,10 +59,9 @@ class TradeManager:
                 # Execute trade via wallet tracker
                 profit_loss = await self.wallet_tracker.execute_trade(signal, stake, tp, sl)
 
-                # Update analytics & portfolio
+                # Update analytics & portfolio (market data is recorded by SessionManager)
                 self.portfolio.update_balance(profit_loss)
                 self.analytics.log_trade(signal, stake, tp, sl, profit_loss, confidence)
-                self.analytics.update_market_data(polymarket_odds, btc, eth, link)
 
                 await asyncio.sleep(self.simulation_speed)
             except Exception as e:
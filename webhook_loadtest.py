@@ -0,0 +1,240 @@
+# webhook_loadtest.py
+"""
+Webhook load test.
+
+Starts the bot in webhook mode on localhost with the Bot API pointed at a
+local stand-in, replays synthetic /start and dashboard updates, and reports
+update-handling throughput and latency (POST sent -> bot reply received).
+
+    python webhook_loadtest.py --updates 2000 --clients 32 --rate 200
+
+Without --rate the clients send as fast as the server accepts, which measures
+peak throughput; with --rate the offered load is paced so latency is not
+dominated by queueing.
+"""
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "123456:LOADTEST")
+os.environ.setdefault("SESSION_DIR", tempfile.mkdtemp(prefix="polypulse_sessions_"))
+
+SECRET = "loadtest-secret"
+CHAT_OFFSET = 100000
+
+# ---------- FAKE BOT API ----------
+
+class FakeBotAPI:
+    """
+    Minimal Bot API stand-in. Records when the bot replies to each chat.
+    """
+
+    def __init__(self, port):
+        self.replies = {}
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length).decode() if length else ""
+                params = api._parse(body, self.headers.get("Content-Type", ""))
+                method = self.path.rsplit("/", 1)[-1]
+
+                result = api._result(method, params)
+                payload = json.dumps({"ok": True, "result": result}).encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    @staticmethod
+    def _parse(body, content_type):
+        if not body:
+            return {}
+        if "json" in content_type:
+            return json.loads(body)
+        return {k: v[0] for k, v in parse_qs(body).items()}
+
+    def _result(self, method, params):
+        if method == "getMe":
+            return {"id": 1, "is_bot": True, "first_name": "PolyPulse", "username": "polypulse_bot"}
+        if method in ("sendMessage", "editMessageText"):
+            chat_id = int(params.get("chat_id", 0))
+            with self.lock:
+                self.replies.setdefault(chat_id, time.perf_counter())
+            return {
+                "message_id": 1,
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "text": params.get("text", "")
+            }
+        return True
+
+# ---------- SYNTHETIC UPDATES ----------
+
+def make_update(i):
+    chat_id = CHAT_OFFSET + i
+    user = {"id": chat_id, "is_bot": False, "first_name": "Load"}
+    chat = {"id": chat_id, "type": "private"}
+
+    if i % 2 == 0:
+        return chat_id, {
+            "update_id": i,
+            "message": {
+                "message_id": i,
+                "date": int(time.time()),
+                "chat": chat,
+                "from": user,
+                "text": "/start",
+                "entities": [{"type": "bot_command", "offset": 0, "length": 6}]
+            }
+        }
+
+    return chat_id, {
+        "update_id": i,
+        "callback_query": {
+            "id": str(i),
+            "from": user,
+            "chat_instance": str(chat_id),
+            "data": "dashboard",
+            "message": {
+                "message_id": 1,
+                "date": int(time.time()),
+                "chat": chat,
+                "text": "menu"
+            }
+        }
+    }
+
+# ---------- CLIENT ----------
+
+def replay(port, path, updates, clients, rate=0):
+    """
+    POSTs every update over `clients` keep-alive connections,
+    optionally paced to `rate` updates/s in total.
+    Returns {chat_id: send_time}.
+    """
+    sent = {}
+    chunks = [updates[i::clients] for i in range(clients)]
+    interval = clients / rate if rate else 0
+    start = time.perf_counter()
+
+    def worker(index, chunk):
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        headers = {
+            "Content-Type": "application/json",
+            "X-Telegram-Bot-Api-Secret-Token": SECRET
+        }
+        for n, (chat_id, update) in enumerate(chunk):
+            if interval:
+                delay = start + (n + index / clients) * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            body = json.dumps(update).encode()
+            sent[chat_id] = time.perf_counter()
+            conn.request("POST", f"/{path}", body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                print(f"[LoadTest] update {update['update_id']} -> HTTP {response.status}")
+        conn.close()
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(worker, range(clients), chunks))
+    return sent
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+# ---------- MAIN ----------
+
+async def run(args):
+    import bot
+
+    api = FakeBotAPI(args.api_port)
+    api.start()
+
+    app = bot.build_application(base_url=f"http://127.0.0.1:{api.port}/bot")
+    path = "telegram"
+
+    async with app:
+        await app.updater.start_webhook(
+            listen="127.0.0.1",
+            port=args.port,
+            url_path=path,
+            webhook_url=f"http://127.0.0.1:{args.port}/{path}",
+            secret_token=SECRET
+        )
+        await app.start()
+
+        updates = [make_update(i) for i in range(args.updates)]
+        started = time.perf_counter()
+        sent = await asyncio.to_thread(replay, args.port, path, updates, args.clients, args.rate)
+
+        deadline = time.perf_counter() + args.timeout
+        while len(api.replies) < len(sent) and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+        finished = time.perf_counter()
+
+        await app.updater.stop()
+        await app.stop()
+
+    api.stop()
+
+    latencies = [(api.replies[c] - t) * 1000 for c, t in sent.items() if c in api.replies]
+    elapsed = finished - started
+
+    print("📈 Webhook Load Test")
+    print(f"Updates: {len(sent)} sent, {len(latencies)} handled "
+          f"({args.clients} clients, concurrent_updates={bot.CONCURRENT_UPDATES})")
+    print(f"Elapsed: {elapsed:.2f}s")
+    print(f"Throughput: {len(latencies) / elapsed:.1f} updates/s")
+    if latencies:
+        print(f"Latency p50: {percentile(latencies, 50):.1f} ms")
+        print(f"Latency p99: {percentile(latencies, 99):.1f} ms")
+        print(f"Latency max: {max(latencies):.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay synthetic updates against a local webhook server")
+    parser.add_argument("--updates", type=int, default=1000)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=0, help="offered load in updates/s (0 = unpaced)")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--api-port", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
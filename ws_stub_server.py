@@ -0,0 +1,112 @@
+# ws_stub_server.py
+"""
+Local stand-in for the price/odds websocket feed used by StreamFeed.
+
+    python ws_stub_server.py --port 8765 --rate 20
+    FEED_WS_URL=ws://127.0.0.1:8765 python bot.py
+
+--drop skips a fraction of sequence numbers (to exercise gap detection) and
+--disconnect-every closes each connection after N messages (to exercise
+reconnect and resubscription).
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import websockets
+
+BASE_PRICES = {"BTC": 65000.0, "ETH": 3200.0, "LINK": 18.0}
+
+
+class StubFeedServer:
+    def __init__(self, host="127.0.0.1", port=8765, rate=20.0, drop=0.0, disconnect_every=0):
+        self.host = host
+        self.port = port
+        self.rate = rate  # ticks per second (one message per symbol per tick)
+        self.drop = drop
+        self.disconnect_every = disconnect_every
+        self.prices = dict(BASE_PRICES)
+        self.up_prob = 0.5
+        self.server = None
+
+    async def start(self):
+        self.server = await websockets.serve(self._handler, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self):
+        return f"ws://{self.host}:{self.port}"
+
+    async def _handler(self, ws, path=None):
+        request = json.loads(await ws.recv())
+        if request.get("type") != "subscribe":
+            await ws.close(code=1008, reason="expected subscribe")
+            return
+
+        channels = set(request.get("channels", ["price", "odds"]))
+        symbols = request.get("symbols") or list(BASE_PRICES) + ["POLY"]
+        await ws.send(json.dumps({"type": "subscribed", "channels": sorted(channels)}))
+
+        seq = {s: 0 for s in symbols}
+        sent = 0
+        try:
+            while True:
+                batch = []
+                for symbol in symbols:
+                    msg = self._next(symbol, channels)
+                    if msg is None:
+                        continue
+                    seq[symbol] += 1
+                    if self.drop and random.random() < self.drop:
+                        continue  # simulated loss: the sequence number is skipped
+                    msg["seq"] = seq[symbol]
+                    batch.append(msg)
+
+                await ws.send(json.dumps(batch))
+                sent += len(batch)
+
+                if self.disconnect_every and sent >= self.disconnect_every:
+                    await ws.close()
+                    return
+                await asyncio.sleep(1 / self.rate)
+        except websockets.ConnectionClosed:
+            pass  # client went away
+
+    def _next(self, symbol, channels):
+        ts = time.time()
+        if symbol == "POLY":
+            if "odds" not in channels:
+                return None
+            self.up_prob = min(0.99, max(0.01, self.up_prob + random.uniform(-0.01, 0.01)))
+            up_prob = round(self.up_prob, 4)
+            return {"channel": "odds", "symbol": symbol, "up_prob": up_prob,
+                    "down_prob": round(1 - up_prob, 4), "ts": ts}
+
+        if "price" not in channels or symbol not in self.prices:
+            return None
+        self.prices[symbol] *= 1 + random.uniform(-0.003, 0.003)
+        return {"channel": "price", "symbol": symbol, "price": round(self.prices[symbol], 4), "ts": ts}
+
+
+async def _serve(args):
+    server = await StubFeedServer(args.host, args.port, args.rate, args.drop, args.disconnect_every).start()
+    print(f"📡 Stub feed serving on {server.url}")
+    await asyncio.Future()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in websocket price/odds feed")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--drop", type=float, default=0.0)
+    parser.add_argument("--disconnect-every", type=int, default=0)
+    asyncio.run(_serve(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()